@@ -3,12 +3,31 @@ Configuration management for Whisper Auto Control application.
 Handles settings, paths, and persistent configuration storage.
 """
 
+import atexit
+import functools
+import hashlib
 import json
 import os
 import sys
+import threading
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    # orjson is optional; the stdlib produces the same file format
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+    _loads = json.loads
+
 
 class Config:
     """Configuration manager for the application."""
@@ -39,9 +58,11 @@ class Config:
         'large',
         'turbo'
     ]
+    # Set view of WHISPER_MODELS for O(1) membership checks; the list keeps UI order
+    WHISPER_MODELS_SET: frozenset = frozenset(WHISPER_MODELS)
 
-    # Default settings
-    DEFAULT_SETTINGS = {
+    # Default settings (read-only; copy before modifying)
+    DEFAULT_SETTINGS = MappingProxyType({
         'selected_model': 'base',
         'auto_start': False,
         'minimize_to_tray': False,
@@ -49,17 +70,30 @@ class Config:
         'python_path': r'C:\whisper\venv\Scripts\python.exe',
         'script_path': r'C:\whisper\ptt_whisper.py',
         'window_geometry': '600x500',
-        'window_position': None
-    }
+        'max_output_lines': 2000
+    })
+    # Keys earlier versions wrote that are no longer used; dropped on load
+    _retired_keys = frozenset({'window_position'})
+
+    # Delay in seconds used to coalesce bursts of setting changes into one write
+    SAVE_DELAY = 0.5
 
     def __init__(self):
         """Initialize configuration manager."""
         self.config_dir = Path.home() / '.whisper_auto'
         self.config_file = self.config_dir / 'config.json'
         self.settings: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._flush_scheduled = False
+        self._save_timer: Optional[threading.Timer] = None
         self._ensure_config_dir()
+        self._last_hash: Optional[bytes] = None
         self.load()
 
+        # Make sure pending changes reach disk even if nobody calls save()
+        atexit.register(self.save)
+
     def _ensure_config_dir(self) -> None:
         """Ensure configuration directory exists."""
         self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -68,31 +102,117 @@ class Config:
         """Load configuration from file."""
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_settings = json.load(f)
-                    # Merge with defaults to ensure all keys exist
-                    self.settings = {**self.DEFAULT_SETTINGS, **loaded_settings}
+                with open(self.config_file, 'rb') as f:
+                    raw = f.read()
+                loaded_settings = _loads(raw)
+
+                for key in self._retired_keys & loaded_settings.keys():
+                    del loaded_settings[key]
+
+                # Merge with defaults to ensure all keys exist; unknown keys
+                # may come from a newer version, so they are kept
+                self.settings = self.DEFAULT_SETTINGS.copy()
+                self.settings.update(loaded_settings)
+                # Remember the bytes on disk so unchanged saves can be skipped,
+                # and rewrite a file missing new defaults or in an old layout
+                self._last_hash = hashlib.blake2b(raw).digest()
+                self._dirty = self._serialize() != raw
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Error loading config: {e}. Using defaults.")
                 self.settings = self.DEFAULT_SETTINGS.copy()
+                self._last_hash = None
         else:
             self.settings = self.DEFAULT_SETTINGS.copy()
+            self._last_hash = None
+
+    def _serialize(self) -> bytes:
+        """Serialize settings to the bytes written to the config file."""
+        return _dumps(self.settings)
 
     def save(self) -> None:
-        """Save configuration to file."""
+        """Write any pending changes to file immediately."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._flush()
+
+    def schedule_save(self) -> None:
+        """Schedule a deferred save so that bursts of changes cause one write."""
+        with self._lock:
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self._flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _flush(self) -> None:
+        """Write settings to file if they changed since the last write."""
+        with self._lock:
+            self._flush_scheduled = False
+            self._save_timer = None
+            if not self._dirty:
+                return
+
+            # Skip the write entirely when nothing actually changed
+            data = self._serialize()
+            digest = hashlib.blake2b(data).digest()
+            if digest == self._last_hash:
+                self._dirty = False
+                return
+
+            tmp_path = self.config_file.with_suffix('.json.tmp')
+            try:
+                # Write to a temp file, fsync once and swap it in so a crash
+                # never leaves a truncated config behind
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.config_file)
+                self._fsync_config_dir()
+                self._last_hash = digest
+                self._dirty = False
+            except (IOError, OSError) as e:
+                print(f"Error saving config: {e}")
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
+
+    def _fsync_config_dir(self) -> None:
+        """Persist the rename by syncing the config directory (POSIX only)."""
+        if sys.platform == 'win32':
+            return
+
+        dir_fd = os.open(self.config_dir, os.O_RDONLY)
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=4)
-        except IOError as e:
-            print(f"Error saving config: {e}")
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
         return self.settings.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
-        """Set configuration value."""
-        self.settings[key] = value
+        """Set configuration value and schedule a save."""
+        with self._lock:
+            self.settings[key] = value
+            self._dirty = True
+        self.schedule_save()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the commonly read settings at once, validated like their getters."""
+        return {
+            'selected_model': self.get_selected_model(),
+            'python_path': self.get_python_path(),
+            'script_path': self.get_script_path(),
+            'window_geometry': self.get_window_geometry(),
+            'minimize_to_tray': self.get_minimize_to_tray(),
+            'max_output_lines': self.get_max_output_lines()
+        }
 
     def get_python_path(self) -> str:
         """Get Python interpreter path."""
@@ -113,11 +233,11 @@ class Config:
     def get_selected_model(self) -> str:
         """Get selected Whisper model."""
         model = self.get('selected_model', 'base')
-        return model if model in self.WHISPER_MODELS else 'base'
+        return model if model in self.WHISPER_MODELS_SET else 'base'
 
     def set_selected_model(self, model: str) -> None:
         """Set selected Whisper model."""
-        if model in self.WHISPER_MODELS:
+        if model in self.WHISPER_MODELS_SET:
             self.set('selected_model', model)
 
     def get_window_geometry(self) -> Optional[str]:
@@ -128,13 +248,12 @@ class Config:
         """Set window geometry."""
         self.set('window_geometry', geometry)
 
-    def get_window_position(self) -> Optional[str]:
-        """Get saved window position."""
-        return self.get('window_position')
-
-    def set_window_position(self, position: str) -> None:
-        """Set window position."""
-        self.set('window_position', position)
+    def get_max_output_lines(self) -> int:
+        """Get maximum number of lines kept in the output display."""
+        value = self.get('max_output_lines')
+        if isinstance(value, int) and value > 0:
+            return value
+        return self.DEFAULT_SETTINGS['max_output_lines']
 
     def get_minimize_to_tray(self) -> bool:
         """Get minimize to tray setting."""
@@ -145,5 +264,14 @@ class Config:
         self.set('minimize_to_tray', enabled)
 
 
-# Global config instance
-config = Config()
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the shared configuration instance, creating it on first use."""
+    return Config()
+
+
+def __getattr__(name: str) -> Any:
+    """Create the global config instance lazily on first access."""
+    if name == 'config':
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
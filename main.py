@@ -4,46 +4,156 @@ Main application entry point with CustomTkinter interface.
 """
 
 import customtkinter as ctk
+import functools
+import re
 import threading
 import time
-from datetime import datetime
-from typing import Optional
-from tkinter import messagebox, filedialog
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import localtime, strftime
+from types import SimpleNamespace
+from typing import Optional, Dict, Any, Callable
 from config import config, Config
 from whisper_controller import controller, WhisperController
 from PIL import Image, ImageDraw
 import pystray
 
 
+# Tk geometry string: WIDTHxHEIGHT with optional +X+Y offsets
+_GEOMETRY_RE = re.compile(r'^\d+x\d+([+-]-?\d+[+-]-?\d+)?$')
+
+
+# Keys still handled by the read-only output textbox
+_OUTPUT_NAVIGATION_KEYS = frozenset({
+    "Left", "Right", "Up", "Down", "Home", "End", "Prior", "Next",
+    "Shift_L", "Shift_R", "Control_L", "Control_R"
+})
+
+
+# Last formatted timestamp as [epoch second, "HH:MM:SS"]
+_ts_cache = [0, ""]
+
+
+def _timestamp() -> str:
+    """Get the current HH:MM:SS timestamp, formatting it at most once per second."""
+    sec = int(time.time())
+    if sec != _ts_cache[0]:
+        _ts_cache[:] = [sec, strftime("%H:%M:%S", localtime(sec))]
+    return _ts_cache[1]
+
+
+@functools.lru_cache(maxsize=1)
+def _tray_icon_image() -> Image.Image:
+    """Create the system tray icon image; built once and reused."""
+    # Create a simple icon (64x64) with a blue circle
+    width = 64
+    height = 64
+    icon_image = Image.new('RGB', (width, height), color='black')
+    draw = ImageDraw.Draw(icon_image)
+
+    # Draw circle
+    padding = 8
+    draw.ellipse(
+        [padding, padding, width - padding, height - padding],
+        fill='#00d4ff',
+        outline='white',
+        width=2
+    )
+
+    return icon_image
+
+
+def _grid_label(parent, text: str, font: ctk.CTkFont, row: int, padx=10, pady=5) -> ctk.CTkLabel:
+    """Create a left-aligned caption label in column 0 of a grid layout."""
+    label = ctk.CTkLabel(parent, text=text, font=font, anchor="w")
+    label.grid(row=row, column=0, padx=padx, pady=pady, sticky="w")
+    return label
+
+
 class WhisperAutoGUI(ctk.CTk):
     """Main GUI application for Whisper Auto Control."""
 
+    # Log and process output arriving within this window (ms) is inserted together
+    OUTPUT_FLUSH_INTERVAL_MS = 50
+
+    # Status watchdog intervals (ms); the watchdog only backs up pushed updates
+    STATUS_WATCHDOG_RUNNING_MS = 2000
+    STATUS_WATCHDOG_IDLE_MS = 5000
+
+    # Seconds a queried controller status is reused before querying again
+    STATUS_CACHE_TTL = 0.1
+
+    # Minimum seconds between tray notifications
+    NOTIFY_MIN_INTERVAL = 1.0
+
+    # Interval (ms) at which queued download progress lines are logged
+    PROGRESS_FLUSH_INTERVAL_MS = 200
+
     def __init__(self):
         """Initialize the GUI application."""
         super().__init__()
 
         # Application state
         self.is_running = False
-        self.status_update_thread: Optional[threading.Thread] = None
-        self.stop_status_thread = False
+        self.status_watchdog_id: Optional[str] = None
         self.tray_icon: Optional[pystray.Icon] = None
         self.is_visible = True
         self.output_expanded = False
         self.process_output_line_count = 0  # Line counter for heartbeat visualization
+        self._displayed_status: tuple = (None, None, None)
+        self._widget_state: Dict[Any, Dict[str, Any]] = {}
+        self._cached_status: Optional[Dict[str, Any]] = None
+        self._cached_status_time = 0.0
+        self._config_dialog: Optional["ConfigDialog"] = None
+        self._last_notify_time = 0.0
+
+        # Single worker thread running controller jobs one at a time
+        self._busy = False
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper-ctl")
+        # Downloads can take minutes, so they run apart from start/stop
+        self._download_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper-dl")
+
+        # Settings snapshot read by the GUI; refreshed after settings change
+        self._cfg = config.snapshot()
+
+        # Oldest output lines are dropped beyond this count to bound memory
+        self.max_output_lines = self._cfg['max_output_lines']
+
+        # Queued (text, tag) log and process output, inserted by batched flushes.
+        # Bounded so output held back while the window is hidden cannot grow
+        # forever; the bound counts queued entries, and one entry (e.g. a
+        # batch of download progress) may hold several lines.
+        self._output_queue: deque = deque(maxlen=self.max_output_lines)
+        self._output_flush_pending = False
+        self._output_lock = threading.Lock()
 
         # Configure window
         self.title(config.APP_NAME)
-        self.geometry("600x500")
         self.minsize(600, 550)
 
         # Set theme
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
 
-        # Configure colors
-        self.colors = config.COLORS
-
-        # Restore window geometry if saved
+        # Shared fonts, one instance per style instead of one per widget
+        self.fonts = {
+            'title': ctk.CTkFont(size=24, weight="bold"),
+            'bold_lg': ctk.CTkFont(size=14, weight="bold"),
+            'bold_md': ctk.CTkFont(size=12, weight="bold"),
+            'normal_md': ctk.CTkFont(size=12),
+            'normal_sm': ctk.CTkFont(size=11),
+            'normal_xs': ctk.CTkFont(size=10),
+            'mono_xs': ctk.CTkFont(size=10, family="Consolas")
+        }
+
+        # Configure colors (attribute access, e.g. self.colors.primary)
+        self.colors = SimpleNamespace(**config.COLORS)
+        self._color_running = self.colors.success
+        self._color_stopped = self.colors.error
+        self._color_pid = self.colors.text
+        self._color_no_pid = self.colors.text_secondary
+
+        # Apply saved (or default) window geometry in a single call
         self._restore_window_geometry()
 
         # Setup UI
@@ -51,21 +161,23 @@ class WhisperAutoGUI(ctk.CTk):
 
         # Setup controller callbacks
         controller.set_log_callback(self._log_message)
-        controller.set_status_callback(self._update_status_display)
-        controller.set_process_output_callback(self._append_process_output)
+        controller.set_status_callback(
+            lambda status: self.after(0, self._update_status_display, status)
+        )
+        controller.set_process_output_batch_callback(self._append_process_output)
 
         # Setup system tray
         self._setup_system_tray()
 
-        # Start status update thread
-        self._start_status_thread()
+        # Start status watchdog for process state the controller cannot report
+        self._schedule_status_watchdog()
 
         # Protocol for window close
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
 
         # Bind minimize event if minimize_to_tray is enabled
-        if config.get_minimize_to_tray():
-            self.bind("<Unmap>", self._on_minimize)
+        if self._cfg['minimize_to_tray']:
+            self.bind("<Unmap>", self._on_minimize, add="+")
 
         # Initial status update
         self._update_status_display()
@@ -100,14 +212,14 @@ class WhisperAutoGUI(ctk.CTk):
 
     def _create_header(self):
         """Create header section."""
-        header_frame = ctk.CTkFrame(self, fg_color=self.colors['secondary'], corner_radius=10)
+        header_frame = ctk.CTkFrame(self, fg_color=self.colors.secondary, corner_radius=10)
         header_frame.grid(row=0, column=0, padx=10, pady=(10, 5), sticky="ew")
 
         title_label = ctk.CTkLabel(
             header_frame,
             text=config.APP_NAME,
-            font=ctk.CTkFont(size=24, weight="bold"),
-            text_color=self.colors['primary']
+            font=self.fonts['title'],
+            text_color=self.colors.primary
         )
         title_label.pack(pady=15)
 
@@ -122,9 +234,9 @@ class WhisperAutoGUI(ctk.CTk):
             button_frame,
             text="START",
             command=self._on_start,
-            fg_color=self.colors['success'],
+            fg_color=self.colors.success,
             hover_color="#00cc70",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.fonts['bold_lg'],
             height=40
         )
         self.start_button.grid(row=0, column=0, padx=5, sticky="ew")
@@ -134,9 +246,9 @@ class WhisperAutoGUI(ctk.CTk):
             button_frame,
             text="STOP",
             command=self._on_stop,
-            fg_color=self.colors['error'],
+            fg_color=self.colors.error,
             hover_color="#cc3333",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self.fonts['bold_lg'],
             height=40,
             state="disabled"
         )
@@ -144,78 +256,56 @@ class WhisperAutoGUI(ctk.CTk):
 
     def _create_status_display(self):
         """Create status display section."""
-        status_frame = ctk.CTkFrame(self, fg_color=self.colors['secondary'], corner_radius=10)
+        status_frame = ctk.CTkFrame(self, fg_color=self.colors.secondary, corner_radius=10)
         status_frame.grid(row=2, column=0, padx=10, pady=5, sticky="ew")
         status_frame.grid_columnconfigure(1, weight=1)
 
-        # Status labels
-        labels = [
-            ("Status:", 0),
-            ("PID:", 1),
-            ("Model:", 2)
-        ]
-
-        for label_text, row in labels:
-            label = ctk.CTkLabel(
-                status_frame,
-                text=label_text,
-                font=ctk.CTkFont(size=12, weight="bold"),
-                anchor="w"
-            )
-            label.grid(row=row, column=0, padx=10, pady=5, sticky="w")
-
-        # Status values
-        self.status_label = ctk.CTkLabel(
-            status_frame,
-            text="Stopped",
-            font=ctk.CTkFont(size=12),
-            text_color=self.colors['error'],
-            anchor="w"
+        # Caption and value label per row: (caption, attribute, initial text, color)
+        rows = (
+            ("Status:", 'status_label', "Stopped", self.colors.error),
+            ("PID:", 'pid_label', "N/A", self.colors.text_secondary),
+            ("Model:", 'model_status_label', self._cfg['selected_model'], self.colors.primary)
         )
-        self.status_label.grid(row=0, column=1, padx=10, pady=5, sticky="w")
+        for row, (caption, attr, text, color) in enumerate(rows):
+            self._create_value_row(
+                status_frame, row, caption, self.fonts['bold_md'],
+                attr, text, self.fonts['normal_md'], color, pady=5
+            )
 
-        self.pid_label = ctk.CTkLabel(
-            status_frame,
-            text="N/A",
-            font=ctk.CTkFont(size=12),
-            text_color=self.colors['text_secondary'],
-            anchor="w"
-        )
-        self.pid_label.grid(row=1, column=1, padx=10, pady=5, sticky="w")
+    def _create_value_row(self, parent, row: int, caption: str, caption_font: ctk.CTkFont,
+                          attr: str, text: str, value_font: ctk.CTkFont, color: str, pady=5):
+        """Create a caption label and a value label stored as self.<attr> on one grid row."""
+        _grid_label(parent, caption, caption_font, row, pady=pady)
 
-        self.model_status_label = ctk.CTkLabel(
-            status_frame,
-            text=config.get_selected_model(),
-            font=ctk.CTkFont(size=12),
-            text_color=self.colors['primary'],
+        value_label = ctk.CTkLabel(
+            parent,
+            text=text,
+            font=value_font,
+            text_color=color,
             anchor="w"
         )
-        self.model_status_label.grid(row=2, column=1, padx=10, pady=5, sticky="w")
+        value_label.grid(row=row, column=1, padx=10, pady=pady, sticky="w")
+        setattr(self, attr, value_label)
 
     def _create_model_section(self):
         """Create model selection and download section."""
-        model_frame = ctk.CTkFrame(self, fg_color=self.colors['secondary'], corner_radius=10)
+        model_frame = ctk.CTkFrame(self, fg_color=self.colors.secondary, corner_radius=10)
         model_frame.grid(row=3, column=0, padx=10, pady=5, sticky="ew")
         model_frame.grid_columnconfigure(1, weight=1)
 
         # Model selector label
-        model_label = ctk.CTkLabel(
-            model_frame,
-            text="Whisper Model:",
-            font=ctk.CTkFont(size=12, weight="bold")
-        )
-        model_label.grid(row=0, column=0, padx=10, pady=10, sticky="w")
+        _grid_label(model_frame, "Whisper Model:", self.fonts['bold_md'], 0, pady=10)
 
         # Model dropdown
         self.model_selector = ctk.CTkOptionMenu(
             model_frame,
             values=config.WHISPER_MODELS,
             command=self._on_model_change,
-            fg_color=self.colors['background'],
-            button_color=self.colors['primary'],
+            fg_color=self.colors.background,
+            button_color=self.colors.primary,
             button_hover_color="#0099cc"
         )
-        self.model_selector.set(config.get_selected_model())
+        self.model_selector.set(self._cfg['selected_model'])
         self.model_selector.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
 
         # Download button
@@ -223,7 +313,7 @@ class WhisperAutoGUI(ctk.CTk):
             model_frame,
             text="Download Model",
             command=self._on_download_model,
-            fg_color=self.colors['primary'],
+            fg_color=self.colors.primary,
             hover_color="#0099cc",
             width=150
         )
@@ -231,53 +321,28 @@ class WhisperAutoGUI(ctk.CTk):
 
     def _create_config_section(self):
         """Create configuration display section."""
-        config_frame = ctk.CTkFrame(self, fg_color=self.colors['secondary'], corner_radius=10)
+        config_frame = ctk.CTkFrame(self, fg_color=self.colors.secondary, corner_radius=10)
         config_frame.grid(row=4, column=0, padx=10, pady=5, sticky="ew")
         config_frame.grid_columnconfigure(1, weight=1)
 
-        # Python path
-        python_label = ctk.CTkLabel(
-            config_frame,
-            text="Python:",
-            font=ctk.CTkFont(size=11),
-            anchor="w"
-        )
-        python_label.grid(row=0, column=0, padx=10, pady=3, sticky="w")
-
-        self.python_path_label = ctk.CTkLabel(
-            config_frame,
-            text=config.get_python_path(),
-            font=ctk.CTkFont(size=10),
-            text_color=self.colors['text_secondary'],
-            anchor="w"
-        )
-        self.python_path_label.grid(row=0, column=1, padx=10, pady=3, sticky="w")
-
-        # Script path
-        script_label = ctk.CTkLabel(
-            config_frame,
-            text="Script:",
-            font=ctk.CTkFont(size=11),
-            anchor="w"
-        )
-        script_label.grid(row=1, column=0, padx=10, pady=3, sticky="w")
-
-        self.script_path_label = ctk.CTkLabel(
-            config_frame,
-            text=config.get_script_path() or "Not configured",
-            font=ctk.CTkFont(size=10),
-            text_color=self.colors['text_secondary'],
-            anchor="w"
+        # Python and script paths: (caption, attribute, initial text)
+        rows = (
+            ("Python:", 'python_path_label', self._cfg['python_path']),
+            ("Script:", 'script_path_label', self._cfg['script_path'] or "Not configured")
         )
-        self.script_path_label.grid(row=1, column=1, padx=10, pady=3, sticky="w")
+        for row, (caption, attr, text) in enumerate(rows):
+            self._create_value_row(
+                config_frame, row, caption, self.fonts['normal_sm'],
+                attr, text, self.fonts['normal_xs'], self.colors.text_secondary, pady=3
+            )
 
         # Configure button
         config_button = ctk.CTkButton(
             config_frame,
             text="Configure Paths",
             command=self._on_configure_paths,
-            fg_color=self.colors['background'],
-            hover_color=self.colors['secondary'],
+            fg_color=self.colors.background,
+            hover_color=self.colors.secondary,
             width=120,
             height=25
         )
@@ -285,7 +350,7 @@ class WhisperAutoGUI(ctk.CTk):
 
     def _create_unified_output_section(self):
         """Create unified activity and process output section."""
-        output_frame = ctk.CTkFrame(self, fg_color=self.colors['secondary'], corner_radius=10)
+        output_frame = ctk.CTkFrame(self, fg_color=self.colors.secondary, corner_radius=10)
         output_frame.grid(row=5, column=0, padx=10, pady=5, sticky="nsew")
         output_frame.grid_columnconfigure(0, weight=1)
         output_frame.grid_rowconfigure(1, weight=1)
@@ -298,7 +363,7 @@ class WhisperAutoGUI(ctk.CTk):
         output_header = ctk.CTkLabel(
             header_frame,
             text="Activity & Process Output",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self.fonts['bold_md'],
             anchor="w"
         )
         output_header.grid(row=0, column=0, sticky="w")
@@ -310,58 +375,47 @@ class WhisperAutoGUI(ctk.CTk):
             command=self._clear_unified_output,
             width=80,
             height=25,
-            fg_color=self.colors['background'],
-            hover_color=self.colors['secondary']
+            fg_color=self.colors.background,
+            hover_color=self.colors.secondary
         )
         self.output_clear_button.grid(row=0, column=1, sticky="e")
 
         # Unified output textbox (always visible)
         self.output_textbox = ctk.CTkTextbox(
             output_frame,
-            fg_color=self.colors['background'],
-            font=ctk.CTkFont(size=10, family="Consolas"),
-            wrap="word",
-            state="disabled"
+            fg_color=self.colors.background,
+            font=self.fonts['mono_xs'],
+            wrap="word"
         )
         self.output_textbox.grid(row=1, column=0, padx=10, pady=(0, 10), sticky="nsew")
 
+        # stderr lines are colored through a tag configured once
+        self.output_textbox.tag_config("stderr", foreground=self.colors.error)
+
+        # Keep the textbox writable for the app but read-only for the user,
+        # so inserts need no state toggling
+        self.output_textbox.bind("<Key>", self._block_output_edit)
+        for event in ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>"):
+            self.output_textbox.bind(event, lambda e: "break")
+
     def _create_footer(self):
         """Create footer section."""
-        footer_frame = ctk.CTkFrame(self, fg_color=self.colors['secondary'], corner_radius=10)
+        footer_frame = ctk.CTkFrame(self, fg_color=self.colors.secondary, corner_radius=10)
         footer_frame.grid(row=6, column=0, padx=10, pady=(5, 10), sticky="ew")
 
         footer_text = f"{config.APP_NAME} v{config.APP_VERSION} | {config.APP_AUTHOR}"
         footer_label = ctk.CTkLabel(
             footer_frame,
             text=footer_text,
-            font=ctk.CTkFont(size=10),
-            text_color=self.colors['text_secondary']
+            font=self.fonts['normal_xs'],
+            text_color=self.colors.text_secondary
         )
         footer_label.pack(pady=8)
 
-    def _create_tray_icon(self) -> Image.Image:
-        """Create system tray icon image."""
-        # Create a simple icon (64x64) with a blue circle
-        width = 64
-        height = 64
-        icon_image = Image.new('RGB', (width, height), color='black')
-        draw = ImageDraw.Draw(icon_image)
-
-        # Draw circle
-        padding = 8
-        draw.ellipse(
-            [padding, padding, width - padding, height - padding],
-            fill='#00d4ff',
-            outline='white',
-            width=2
-        )
-
-        return icon_image
-
     def _setup_system_tray(self):
         """Setup system tray icon and menu."""
         # Create tray icon
-        icon_image = self._create_tray_icon()
+        icon_image = _tray_icon_image()
 
         # Create menu
         menu = pystray.Menu(
@@ -373,12 +427,12 @@ class WhisperAutoGUI(ctk.CTk):
             pystray.MenuItem(
                 'Start Whisper',
                 self._tray_start_whisper,
-                enabled=lambda item: not controller.is_running()
+                enabled=lambda item: not self._refresh_status()['running']
             ),
             pystray.MenuItem(
                 'Stop Whisper',
                 self._tray_stop_whisper,
-                enabled=lambda item: controller.is_running()
+                enabled=lambda item: self._refresh_status()['running']
             ),
             pystray.Menu.SEPARATOR,
             pystray.MenuItem(
@@ -417,9 +471,17 @@ class WhisperAutoGUI(ctk.CTk):
         self.focus_force()
         self.is_visible = True
 
+        # Insert output that arrived while the window was hidden
+        self._flush_output()
+
     def _on_minimize(self, event):
         """Handle window minimize event."""
-        if config.get_minimize_to_tray() and event.widget == self:
+        # <Unmap> also fires for child widgets and for withdraw(); only an
+        # actual minimize of this window should hide it to the tray
+        if event.widget is not self or self.state() != "iconic":
+            return
+
+        if self._cfg['minimize_to_tray']:
             # Small delay to let minimize complete
             self.after(100, self._hide_window)
 
@@ -436,16 +498,64 @@ class WhisperAutoGUI(ctk.CTk):
         self.after(0, self._on_closing)
 
     def _show_notification(self, title: str, message: str):
-        """Show system tray notification."""
-        if self.tray_icon:
+        """Show system tray notification.
+
+        Notifications closer together than NOTIFY_MIN_INTERVAL are dropped.
+        """
+        if not self.tray_icon:
+            return
+
+        now = time.monotonic()
+        if now - self._last_notify_time < self.NOTIFY_MIN_INTERVAL:
+            return
+        self._last_notify_time = now
+
+        # pystray only posts the notification to the tray thread, so this
+        # returns immediately
+        try:
             self.tray_icon.notify(message, title)
+        except Exception as e:
+            self._log_message(f"Could not show notification: {e}")
+
+    def _on_job_done(self, future: Future):
+        """Clear the busy flag and report errors once a worker job finishes."""
+        self._busy = False
+        self._report_job_error(future)
+
+    def _report_job_error(self, future: Future):
+        """Log the error raised by a finished worker job, if any."""
+        error = future.exception()
+        if error is not None:
+            self.after(0, self._log_message, f"Worker job error: {error}")
+
+    def _submit_job(self, job: Callable[[], None]) -> bool:
+        """Queue a job for the worker thread.
+
+        Args:
+            job: Callable to run on the worker thread
+
+        Returns:
+            True if queued, False if another job is still in flight
+        """
+        if self._busy:
+            self._log_message("Please wait for the current operation to finish")
+            return False
+
+        self._busy = True
+        self._worker.submit(job).add_done_callback(self._on_job_done)
+        return True
 
     # Event handlers
     def _on_start(self):
         """Handle start button click."""
+        if self.is_running:
+            return
+
+        model = self.model_selector.get()
+
         def start_async():
-            model = self.model_selector.get()
             success = controller.start(model)
+            self._refresh_status(force=True)
 
             if success:
                 self.after(0, self._set_running_state, True)
@@ -454,7 +564,7 @@ class WhisperAutoGUI(ctk.CTk):
             else:
                 self.after(0, self._log_message, "Failed to start Whisper")
 
-        threading.Thread(target=start_async, daemon=True).start()
+        self._submit_job(start_async)
 
         # Immediately minimize focus impact - don't keep focus on button
         self.after(100, lambda: self.focus())
@@ -463,6 +573,7 @@ class WhisperAutoGUI(ctk.CTk):
         """Handle stop button click."""
         def stop_async():
             success = controller.stop()
+            self._refresh_status(force=True)
 
             if success:
                 self.after(0, self._set_running_state, False)
@@ -470,7 +581,7 @@ class WhisperAutoGUI(ctk.CTk):
             else:
                 self.after(0, self._log_message, "Failed to stop Whisper")
 
-        threading.Thread(target=stop_async, daemon=True).start()
+        self._submit_job(stop_async)
 
         # Immediately minimize focus impact - don't keep focus on button
         self.after(100, lambda: self.focus())
@@ -478,21 +589,37 @@ class WhisperAutoGUI(ctk.CTk):
     def _on_model_change(self, model: str):
         """Handle model selection change."""
         config.set_selected_model(model)
-        config.save()
+        self._cfg = config.snapshot()
         self._log_message(f"Model changed to: {model}")
 
+        # Show the new model right away instead of on the next watchdog tick
+        self._refresh_status(force=True)
+        self._update_status_display()
+
     def _on_download_model(self):
         """Handle download model button click."""
         model = self.model_selector.get()
 
-        # Disable button during download
-        self.download_button.configure(state="disabled", text="Downloading...")
+        # Progress lines are collected here and logged in batches
+        progress_queue: deque = deque()
+        download_done = threading.Event()
+
+        def flush_progress():
+            # Check before draining so lines queued before completion are kept
+            finished = download_done.is_set()
+            lines = []
+            while progress_queue:
+                lines.append(progress_queue.popleft())
+            if lines:
+                self._log_batch(lines)
+            if not finished:
+                self.after(self.PROGRESS_FLUSH_INTERVAL_MS, flush_progress)
 
         def download_async():
-            def progress_callback(message: str):
-                self.after(0, self._log_message, message)
-
-            success = controller.download_model(model, progress_callback)
+            try:
+                success = controller.download_model(model, progress_queue.append)
+            finally:
+                download_done.set()
 
             # Re-enable button
             self.after(0, lambda: self.download_button.configure(
@@ -503,150 +630,243 @@ class WhisperAutoGUI(ctk.CTk):
             if success:
                 self.after(0, self._log_message, f"Model '{model}' ready for use")
 
-        threading.Thread(target=download_async, daemon=True).start()
+        self._download_worker.submit(download_async).add_done_callback(self._report_job_error)
+
+        # Disable button during download
+        self.download_button.configure(state="disabled", text="Downloading...")
+        self.after(self.PROGRESS_FLUSH_INTERVAL_MS, flush_progress)
 
     def _on_configure_paths(self):
         """Handle configure paths button click."""
-        dialog = ConfigDialog(self)
-        self.wait_window(dialog)
+        # Build the dialog once and reuse it for later openings
+        if self._config_dialog is None or not self._config_dialog.winfo_exists():
+            self._config_dialog = ConfigDialog(self, on_close=self._refresh_config_paths)
+        else:
+            self._config_dialog.show()
 
-        # Update displayed paths
-        self.python_path_label.configure(text=config.get_python_path())
-        self.script_path_label.configure(text=config.get_script_path() or "Not configured")
+    def _refresh_config_paths(self):
+        """Update displayed paths from configuration."""
+        self._cfg = config.snapshot()
+        self.python_path_label.configure(text=self._cfg['python_path'])
+        self.script_path_label.configure(text=self._cfg['script_path'] or "Not configured")
 
     def _set_running_state(self, running: bool):
         """Set UI state based on running status."""
         self.is_running = running
 
         if running:
-            self.start_button.configure(state="disabled")
-            self.stop_button.configure(state="normal")
+            self._set_widget(self.start_button, state="disabled")
+            self._set_widget(self.stop_button, state="normal")
         else:
-            self.start_button.configure(state="normal")
-            self.stop_button.configure(state="disabled")
-
-    def _update_status_display(self, status_text: Optional[str] = None):
-        """Update status display with current information."""
-        status = controller.get_status()
-
-        # Update status text
-        if status['running']:
-            self.status_label.configure(
-                text="Running",
-                text_color=self.colors['success']
-            )
+            self._set_widget(self.start_button, state="normal")
+            self._set_widget(self.stop_button, state="disabled")
+
+    def _set_widget(self, widget, **options):
+        """Configure only the widget options that differ from the last values set.
+
+        Args:
+            widget: Widget to configure
+            **options: Options passed to widget.configure()
+        """
+        state = self._widget_state.setdefault(widget, {})
+        changed = {key: value for key, value in options.items() if state.get(key) != value}
+        if changed:
+            widget.configure(**changed)
+            state.update(changed)
+
+    def _refresh_status(self, force: bool = False) -> Dict[str, Any]:
+        """Get controller status, reusing a recent snapshot.
+
+        Args:
+            force: Query the controller even if the cached snapshot is fresh
+
+        Returns:
+            Status dictionary from controller.get_status()
+        """
+        now = time.monotonic()
+        if (force or self._cached_status is None
+                or now - self._cached_status_time > self.STATUS_CACHE_TTL):
+            self._store_status(controller.get_status(), now)
+        return self._cached_status
+
+    def _store_status(self, status: Dict[str, Any], now: Optional[float] = None):
+        """Remember a status snapshot for _refresh_status()."""
+        self._cached_status = status
+        self._cached_status_time = time.monotonic() if now is None else now
+
+    def _update_status_display(self, status: Optional[Dict[str, Any]] = None):
+        """Update status display with current information.
+
+        Args:
+            status: Status dictionary pushed by the controller, or None to query it
+        """
+        if status is None:
+            status = self._refresh_status()
         else:
-            self.status_label.configure(
-                text="Stopped",
-                text_color=self.colors['error']
-            )
+            self._store_status(status)
+
+        # Skip entirely when nothing visible changed
+        running, pid, model = status['running'], status['pid'], status['model']
+        if (running, pid, model) == self._displayed_status:
+            return
+        self._displayed_status = (running, pid, model)
+
+        # Update status text; _set_widget skips options that did not change
+        if running:
+            self._set_widget(self.status_label, text="Running", text_color=self._color_running)
+        else:
+            self._set_widget(self.status_label, text="Stopped", text_color=self._color_stopped)
 
         # Update PID
-        if status['pid']:
-            self.pid_label.configure(
-                text=str(status['pid']),
-                text_color=self.colors['text']
-            )
+        if pid:
+            self._set_widget(self.pid_label, text=str(pid), text_color=self._color_pid)
         else:
-            self.pid_label.configure(
-                text="N/A",
-                text_color=self.colors['text_secondary']
-            )
+            self._set_widget(self.pid_label, text="N/A", text_color=self._color_no_pid)
 
         # Update model
-        self.model_status_label.configure(text=status['model'])
+        self._set_widget(self.model_status_label, text=model)
 
         # Update button states
-        self._set_running_state(status['running'])
+        self._set_running_state(running)
 
     def _log_message(self, message: str):
-        """Add message to unified output with [LOG] prefix."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] [LOG] {message}\n"
+        """Queue message for the unified output with [LOG] prefix."""
+        self._output_queue.append((f"[{_timestamp()}] [LOG] {message}\n", None))
+        self._schedule_output_flush()
+
+    def _log_batch(self, messages: list):
+        """Queue several messages for the unified output as one entry."""
+        timestamp = _timestamp()
+        self._output_queue.append(
+            ("".join(f"[{timestamp}] [LOG] {message}\n" for message in messages), None)
+        )
+        self._schedule_output_flush()
 
-        self.output_textbox.configure(state="normal")
-        self.output_textbox.insert("end", log_entry)
+    def _schedule_output_flush(self):
+        """Schedule a flush of queued output if none is pending."""
+        with self._output_lock:
+            if self._output_flush_pending:
+                return
+            self._output_flush_pending = True
+        self.after(self.OUTPUT_FLUSH_INTERVAL_MS, self._flush_output)
+
+    def _flush_output(self):
+        """Insert all queued log and process output into the textbox at once."""
+        with self._output_lock:
+            self._output_flush_pending = False
+
+        # Leave output queued while hidden; _show_window flushes it
+        if not self.is_visible:
+            return
+
+        # Group consecutive entries with the same tag into one insert each
+        groups = []
+        while self._output_queue:
+            text, tag = self._output_queue.popleft()
+            if groups and groups[-1][0] == tag:
+                groups[-1][1].append(text)
+            else:
+                groups.append((tag, [text]))
+        if not groups:
+            return
+
+        for tag, texts in groups:
+            self.output_textbox.insert("end", "".join(texts), tag)
+        self._trim_output()
         self.output_textbox.see("end")
-        self.output_textbox.configure(state="disabled")
+
+    def _block_output_edit(self, event) -> Optional[str]:
+        """Reject key presses that would edit the output, keeping copy and navigation."""
+        control_held = event.state & 0x4
+        if control_held and event.keysym.lower() in ("c", "a"):
+            return None
+        if event.keysym in _OUTPUT_NAVIGATION_KEYS:
+            return None
+        return "break"
+
+    def _trim_output(self):
+        """Delete the oldest lines once the output exceeds max_output_lines.
+
+        Only called right after a batched insert, so the check runs once per
+        flush rather than once per line.
+        """
+        line_count = int(self.output_textbox.index("end-1c").split(".")[0])
+        excess = line_count - self.max_output_lines
+        if excess > 0:
+            self.output_textbox.delete("1.0", f"{excess + 1}.0")
 
     def _clear_unified_output(self):
         """Clear unified output display."""
-        self.output_textbox.configure(state="normal")
         self.output_textbox.delete("1.0", "end")
-        self.output_textbox.configure(state="disabled")
 
-    def _append_process_output(self, stream_type: str, message: str):
-        """Thread-safe process output appender."""
-        # Schedule the GUI update on the main thread
-        self.after(0, self._append_process_output_impl, stream_type, message)
+    def _append_process_output(self, lines: list):
+        """Thread-safe process output appender.
 
-    def _append_process_output_impl(self, stream_type: str, message: str):
-        """Implementation of process output appending (runs on main thread).
+        Lines share the log queue so log and process output keep their
+        relative order, and are inserted by the next batched flush.
 
         Args:
-            stream_type: 'stdout' or 'stderr'
-            message: The output message
+            lines: (stream_type, message) tuples, stream_type being 'stdout' or 'stderr'
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-
-        # Increment line counter for heartbeat visualization
-        self.process_output_line_count += 1
-
-        # Color code based on stream type
-        if stream_type == 'stderr':
-            prefix = f"[{timestamp}] [ERR]"
+        timestamp = _timestamp()
+
+        with self._output_lock:
+            for stream_type, message in lines:
+                prefix = "[ERR]" if stream_type == 'stderr' else "[OUT]"
+                # Increment line counter for heartbeat visualization
+                self.process_output_line_count += 1
+                self._output_queue.append((
+                    f"[LINE {self.process_output_line_count}] [{timestamp}] {prefix} {message}\n",
+                    stream_type
+                ))
+        self._schedule_output_flush()
+
+    def _schedule_status_watchdog(self):
+        """Schedule the next slow status check.
+
+        The controller pushes state changes as they happen; this is only a
+        safety net for changes it cannot observe, checked more often while
+        a process is running.
+        """
+        if self.is_running:
+            interval = self.STATUS_WATCHDOG_RUNNING_MS
         else:
-            prefix = f"[{timestamp}] [OUT]"
-
-        output_entry = f"[LINE {self.process_output_line_count}] {prefix} {message}\n"
+            interval = self.STATUS_WATCHDOG_IDLE_MS
+        self.status_watchdog_id = self.after(interval, self._poll_status_once)
 
-        self.output_textbox.configure(state="normal")
-        self.output_textbox.insert("end", output_entry)
-
-        # Auto-scroll to bottom
-        self.output_textbox.see("end")
-        self.output_textbox.configure(state="disabled")
-
-    def _start_status_thread(self):
-        """Start background thread for status updates."""
-        def status_loop():
-            while not self.stop_status_thread:
-                try:
-                    self.after(0, self._update_status_display)
-                    time.sleep(0.5)  # 500ms refresh rate
-                except Exception as e:
-                    print(f"Status thread error: {e}")
-                    break
-
-        self.status_update_thread = threading.Thread(target=status_loop, daemon=True)
-        self.status_update_thread.start()
+    def _poll_status_once(self):
+        """Refresh status display once and reschedule the watchdog."""
+        self._update_status_display()
+        self._schedule_status_watchdog()
 
     def _restore_window_geometry(self):
-        """Restore saved window geometry."""
-        geometry = config.get_window_geometry()
-        if geometry:
-            try:
-                self.geometry(geometry)
-            except:
-                pass
+        """Restore saved window geometry, falling back to the default size."""
+        geometry = self._cfg['window_geometry']
+        if geometry and not _GEOMETRY_RE.match(geometry):
+            self._log_message(f"Warning: Ignoring invalid saved window geometry '{geometry}'")
+            geometry = None
 
-        position = config.get_window_position()
-        if position:
-            try:
-                self.geometry(position)
-            except:
-                pass
+        self.geometry(geometry or Config.DEFAULT_SETTINGS['window_geometry'])
 
     def _save_window_geometry(self):
         """Save current window geometry."""
         geometry = self.geometry()
         config.set_window_geometry(geometry)
-        config.save()
 
     def _on_closing(self):
         """Handle window close event."""
+        # A start or stop still in flight would finish with no GUI left to
+        # report it, possibly leaving Whisper running
+        if self._busy:
+            if not self.is_visible:
+                self._show_window()
+            self._log_message("Please wait for the current operation to finish before exiting")
+            return
+
         # Check if process is running
-        if controller.is_running():
+        if self._refresh_status(force=True)['running']:
+            from tkinter import messagebox
+
             response = messagebox.askyesno(
                 "Confirm Exit",
                 "Whisper is currently running. Stop and exit?",
@@ -659,59 +879,97 @@ class WhisperAutoGUI(ctk.CTk):
             # Stop the process
             controller.stop()
 
-        # Save window geometry
+        # Save window geometry and flush pending settings to disk
         self._save_window_geometry()
+        config.save()
+
+        # End the model download helper, if one was started
+        controller.close_downloader()
 
-        # Stop status thread
-        self.stop_status_thread = True
+        # Stop worker threads once any running job finishes
+        self._worker.shutdown(wait=False)
+        self._download_worker.shutdown(wait=False)
+
+        # Stop status watchdog
+        if self.status_watchdog_id:
+            self.after_cancel(self.status_watchdog_id)
+            self.status_watchdog_id = None
 
         # Stop tray icon
         if self.tray_icon:
             self.tray_icon.stop()
 
         # Destroy window
+        self._config_dialog = None
         self.destroy()
 
 
 class ConfigDialog(ctk.CTkToplevel):
     """Configuration dialog for setting paths."""
 
-    def __init__(self, parent):
-        """Initialize configuration dialog."""
+    def __init__(self, parent, on_close: Optional[Callable[[], None]] = None):
+        """Initialize configuration dialog.
+
+        Args:
+            parent: Parent window the dialog is centered on
+            on_close: Optional callback run each time the dialog is closed
+        """
         super().__init__(parent)
 
+        self.parent = parent
+        self.on_close = on_close
+
         self.title("Configure Paths")
         self.geometry("500x200")
         self.resizable(False, False)
+        self.fonts = parent.fonts
 
-        # Make dialog modal
+        # Closing only hides the dialog so it can be shown again
         self.transient(parent)
-        self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self.close)
 
         self._setup_ui()
+        self.show()
+
+    def show(self):
+        """Show the dialog modally with entries reloaded from configuration."""
+        self._load_entries()
+        self.deiconify()
 
         # Center on parent
         self.update_idletasks()
+        parent = self.parent
         x = parent.winfo_x() + (parent.winfo_width() // 2) - (self.winfo_width() // 2)
         y = parent.winfo_y() + (parent.winfo_height() // 2) - (self.winfo_height() // 2)
         self.geometry(f"+{x}+{y}")
 
+        self.lift()
+        self.grab_set()
+
+    def close(self):
+        """Hide the dialog and notify the parent."""
+        self.grab_release()
+        self.withdraw()
+        if self.on_close:
+            self.on_close()
+
+    def _load_entries(self):
+        """Fill entries with the current configuration values."""
+        self.python_entry.delete(0, "end")
+        self.python_entry.insert(0, config.get_python_path())
+        self.script_entry.delete(0, "end")
+        self.script_entry.insert(0, config.get_script_path())
+
     def _setup_ui(self):
         """Setup dialog UI."""
         # Python path
-        python_label = ctk.CTkLabel(
-            self,
-            text="Python Interpreter:",
-            font=ctk.CTkFont(size=12, weight="bold")
-        )
-        python_label.grid(row=0, column=0, padx=20, pady=(20, 5), sticky="w")
+        _grid_label(self, "Python Interpreter:", self.fonts['bold_md'], 0, padx=20, pady=(20, 5))
 
         python_frame = ctk.CTkFrame(self, fg_color="transparent")
         python_frame.grid(row=1, column=0, padx=20, pady=5, sticky="ew")
         python_frame.grid_columnconfigure(0, weight=1)
 
         self.python_entry = ctk.CTkEntry(python_frame)
-        self.python_entry.insert(0, config.get_python_path())
         self.python_entry.grid(row=0, column=0, sticky="ew", padx=(0, 5))
 
         python_browse = ctk.CTkButton(
@@ -723,19 +981,13 @@ class ConfigDialog(ctk.CTkToplevel):
         python_browse.grid(row=0, column=1)
 
         # Script path
-        script_label = ctk.CTkLabel(
-            self,
-            text="Whisper Script:",
-            font=ctk.CTkFont(size=12, weight="bold")
-        )
-        script_label.grid(row=2, column=0, padx=20, pady=(15, 5), sticky="w")
+        _grid_label(self, "Whisper Script:", self.fonts['bold_md'], 2, padx=20, pady=(15, 5))
 
         script_frame = ctk.CTkFrame(self, fg_color="transparent")
         script_frame.grid(row=3, column=0, padx=20, pady=5, sticky="ew")
         script_frame.grid_columnconfigure(0, weight=1)
 
         self.script_entry = ctk.CTkEntry(script_frame)
-        self.script_entry.insert(0, config.get_script_path())
         self.script_entry.grid(row=0, column=0, sticky="ew", padx=(0, 5))
 
         script_browse = ctk.CTkButton(
@@ -753,7 +1005,7 @@ class ConfigDialog(ctk.CTkToplevel):
         cancel_button = ctk.CTkButton(
             button_frame,
             text="Cancel",
-            command=self.destroy,
+            command=self.close,
             fg_color="gray",
             width=100
         )
@@ -771,6 +1023,8 @@ class ConfigDialog(ctk.CTkToplevel):
 
     def _browse_python(self):
         """Browse for Python interpreter."""
+        from tkinter import filedialog
+
         filename = filedialog.askopenfilename(
             title="Select Python Interpreter",
             filetypes=[("Python", "python.exe"), ("All files", "*.*")]
@@ -781,6 +1035,8 @@ class ConfigDialog(ctk.CTkToplevel):
 
     def _browse_script(self):
         """Browse for Whisper script."""
+        from tkinter import filedialog
+
         filename = filedialog.askopenfilename(
             title="Select Whisper Script",
             filetypes=[("Python files", "*.py"), ("All files", "*.*")]
@@ -793,8 +1049,7 @@ class ConfigDialog(ctk.CTkToplevel):
         """Save configuration."""
         config.set_python_path(self.python_entry.get())
         config.set_script_path(self.script_entry.get())
-        config.save()
-        self.destroy()
+        self.close()
 
 
 def main():
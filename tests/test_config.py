@@ -0,0 +1,190 @@
+"""Unit tests for Config loading and debounced, atomic, skip-if-unchanged saves."""
+
+import atexit
+import json
+import time
+
+import pytest
+
+import config
+from config import Config
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """Point Path.home() at a temporary directory."""
+    monkeypatch.setattr(config.Path, 'home', lambda: tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def replace_calls(monkeypatch):
+    """Count the atomic renames that actually write the config file."""
+    calls = []
+    real_replace = config.os.replace
+
+    def counting_replace(src, dst):
+        calls.append(dst)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(config.os, 'replace', counting_replace)
+    return calls
+
+
+def make_config() -> Config:
+    """Create a Config that does not save again at interpreter exit."""
+    cfg = Config()
+    atexit.unregister(cfg.save)
+    return cfg
+
+
+def write_file(home, settings: dict, indent: int = 2) -> None:
+    """Write a config file as an earlier run would have."""
+    config_dir = home / '.whisper_auto'
+    config_dir.mkdir(exist_ok=True)
+    (config_dir / 'config.json').write_text(json.dumps(settings, indent=indent))
+
+
+def read_file(cfg: Config) -> dict:
+    """Read back the settings Config wrote to disk."""
+    return json.loads(cfg.config_file.read_text())
+
+
+def test_missing_file_uses_defaults(home):
+    cfg = make_config()
+    assert cfg.settings == dict(Config.DEFAULT_SETTINGS)
+    assert not cfg.config_file.exists()
+
+
+def test_burst_of_changes_is_written_once(home, replace_calls, monkeypatch):
+    monkeypatch.setattr(Config, 'SAVE_DELAY', 0.05)
+    cfg = make_config()
+
+    cfg.set_selected_model('small')
+    cfg.set_minimize_to_tray(True)
+    cfg.set_window_geometry('800x600')
+    assert replace_calls == []
+
+    deadline = time.monotonic() + 2
+    while not replace_calls and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.1)
+
+    assert len(replace_calls) == 1
+    saved = read_file(cfg)
+    assert saved['selected_model'] == 'small'
+    assert saved['minimize_to_tray'] is True
+    assert saved['window_geometry'] == '800x600'
+
+
+def test_save_flushes_pending_changes_immediately(home, replace_calls):
+    cfg = make_config()
+    cfg.set_selected_model('tiny')
+
+    cfg.save()
+
+    assert len(replace_calls) == 1
+    assert cfg._save_timer is None
+    assert read_file(cfg)['selected_model'] == 'tiny'
+
+
+def test_unchanged_settings_are_not_rewritten(home, replace_calls):
+    cfg = make_config()
+    cfg.set_selected_model('tiny')
+    cfg.save()
+
+    cfg.set_selected_model('tiny')
+    cfg.save()
+    cfg.save()
+
+    assert len(replace_calls) == 1
+
+
+def test_save_leaves_no_temp_file(home):
+    cfg = make_config()
+    cfg.set_selected_model('tiny')
+    cfg.save()
+
+    assert not cfg.config_file.with_suffix('.json.tmp').exists()
+
+
+def test_failed_write_keeps_previous_file(home, monkeypatch):
+    cfg = make_config()
+    cfg.set_selected_model('tiny')
+    cfg.save()
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(config.os, 'replace', failing_replace)
+    cfg.set_selected_model('large')
+    cfg.save()
+
+    assert read_file(cfg)['selected_model'] == 'tiny'
+    assert not cfg.config_file.with_suffix('.json.tmp').exists()
+    # Still dirty, so a later save retries
+    assert cfg._dirty
+
+
+def test_current_file_is_not_rewritten(home, replace_calls):
+    write_file(home, dict(Config.DEFAULT_SETTINGS))
+    cfg = make_config()
+
+    cfg.save()
+
+    assert replace_calls == []
+
+
+def test_old_format_file_is_rewritten_once(home, replace_calls):
+    write_file(home, dict(Config.DEFAULT_SETTINGS), indent=4)
+    cfg = make_config()
+
+    cfg.save()
+    cfg.save()
+
+    assert len(replace_calls) == 1
+    assert make_config()._dirty is False
+
+
+def test_missing_defaults_are_filled_in(home):
+    write_file(home, {'selected_model': 'medium'})
+    cfg = make_config()
+
+    assert cfg.get_selected_model() == 'medium'
+    assert cfg.get_max_output_lines() == Config.DEFAULT_SETTINGS['max_output_lines']
+
+
+def test_unknown_keys_are_kept(home):
+    write_file(home, {**Config.DEFAULT_SETTINGS, 'added_later': 1})
+    cfg = make_config()
+    cfg.set_selected_model('tiny')
+    cfg.save()
+
+    assert read_file(cfg)['added_later'] == 1
+
+
+def test_retired_keys_are_dropped(home):
+    write_file(home, {**Config.DEFAULT_SETTINGS, 'window_position': '10+10'})
+    cfg = make_config()
+    cfg.save()
+
+    assert 'window_position' not in read_file(cfg)
+
+
+def test_corrupt_file_falls_back_to_defaults(home, capsys):
+    config_dir = home / '.whisper_auto'
+    config_dir.mkdir()
+    (config_dir / 'config.json').write_text('{not json')
+
+    cfg = make_config()
+
+    assert cfg.settings == dict(Config.DEFAULT_SETTINGS)
+    assert 'Error loading config' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('value', [0, -5, 'many', None])
+def test_invalid_max_output_lines_falls_back_to_default(home, value):
+    write_file(home, {'max_output_lines': value})
+    cfg = make_config()
+
+    assert cfg.get_max_output_lines() == Config.DEFAULT_SETTINGS['max_output_lines']
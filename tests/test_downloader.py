@@ -0,0 +1,187 @@
+"""Unit tests for the model download helper and its DONE:/FAILED: protocol."""
+
+import io
+import sys
+import time
+import types
+
+import pytest
+
+import whisper_controller
+from whisper_controller import WhisperController
+
+
+class FakeHelper:
+    """Stand-in for the helper Popen, replaying canned stdout lines."""
+
+    def __init__(self, output: str, returncode: int = 0):
+        self.stdin = io.StringIO()
+        self.stdout = io.StringIO(output)
+        self.returncode = returncode
+        self.exited = False
+
+    def poll(self):
+        return self.returncode if self.exited else None
+
+    def wait(self, timeout=None):
+        self.exited = True
+        return self.returncode
+
+    def kill(self):
+        self.exited = True
+
+
+@pytest.fixture
+def helpers(monkeypatch):
+    """Replace Popen with a factory of FakeHelpers; returns (queue, launched)."""
+    queue = []
+    launched = []
+
+    def fake_popen(cmd, **kwargs):
+        helper = queue.pop(0)
+        launched.append((cmd, helper))
+        return helper
+
+    monkeypatch.setattr(whisper_controller.subprocess, 'Popen', fake_popen)
+    settings = types.SimpleNamespace(get_python_path=lambda: '/usr/bin/python3')
+    monkeypatch.setattr(whisper_controller, 'get_config', lambda: settings)
+    return queue, launched
+
+
+@pytest.fixture
+def controller():
+    """WhisperController that records log messages in .logged."""
+    controller = WhisperController()
+    controller.logged = []
+    controller.set_log_callback(controller.logged.append)
+    yield controller
+    controller.close_downloader()
+
+
+def test_done_marker_reports_success(helpers, controller):
+    queue, launched = helpers
+    helper = FakeHelper("100%|#####|\nDONE:tiny\n")
+    queue.append(helper)
+    progress = []
+
+    assert controller.download_model('tiny', progress.append) is True
+
+    assert helper.stdin.getvalue() == 'tiny\n'
+    assert launched[0][0][:3] == ['/usr/bin/python3', '-u', '-c']
+    assert progress == [
+        "Preparing to download tiny model...",
+        "100%|#####|",
+        "Model 'tiny' downloaded successfully!",
+    ]
+    # Progress lines go to the callback only, not to the log as well
+    assert "100%|#####|" not in controller.logged
+
+
+def test_failed_marker_reports_error(helpers, controller):
+    queue, _ = helpers
+    queue.append(FakeHelper("FAILED:base:HTTP Error 404: Not Found\n"))
+
+    assert controller.download_model('base') is False
+    assert "Error downloading model: HTTP Error 404: Not Found" in controller.logged
+
+
+def test_helper_exit_without_marker_reports_exit_code(helpers, controller):
+    queue, _ = helpers
+    queue.append(FakeHelper("ModuleNotFoundError: No module named 'whisper'\n", returncode=1))
+
+    assert controller.download_model('tiny') is False
+    assert "Error downloading model (exit code: 1)" in controller.logged
+    assert controller._downloader is None
+
+
+def test_helper_is_reused_for_the_next_download(helpers, controller):
+    queue, launched = helpers
+    queue.append(FakeHelper("DONE:tiny\nDONE:base\n"))
+
+    assert controller.download_model('tiny') is True
+    assert controller.download_model('base') is True
+
+    assert len(launched) == 1
+    assert launched[0][1].stdin.getvalue() == 'tiny\nbase\n'
+
+
+def test_interpreter_change_starts_a_new_helper(helpers, controller, monkeypatch):
+    queue, launched = helpers
+    queue.extend([FakeHelper("DONE:tiny\n"), FakeHelper("DONE:tiny\n")])
+
+    controller.download_model('tiny')
+    other = types.SimpleNamespace(get_python_path=lambda: '/opt/python/bin/python3')
+    monkeypatch.setattr(whisper_controller, 'get_config', lambda: other)
+    controller.download_model('tiny')
+
+    assert [cmd[0] for cmd, _ in launched] == ['/usr/bin/python3', '/opt/python/bin/python3']
+    assert launched[0][1].exited
+
+
+def test_invalid_model_does_not_start_helper(helpers, controller):
+    _, launched = helpers
+
+    assert controller.download_model('huge') is False
+    assert launched == []
+
+
+def test_idle_helper_is_shut_down(helpers, controller, monkeypatch):
+    queue, _ = helpers
+    helper = FakeHelper("DONE:tiny\n")
+    queue.append(helper)
+    monkeypatch.setattr(WhisperController, 'DOWNLOADER_IDLE_TIMEOUT', 0.05)
+
+    controller.download_model('tiny')
+    deadline = time.monotonic() + 2
+    while controller._downloader is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert controller._downloader is None
+    assert helper.exited
+
+
+def run_helper_script(monkeypatch, whisper_module, names: str) -> list:
+    """Run _DOWNLOADER_SCRIPT in-process against a fake whisper module.
+
+    Returns:
+        Lines the script printed
+    """
+    monkeypatch.setitem(sys.modules, 'whisper', whisper_module)
+    monkeypatch.setattr(sys, 'stdin', io.StringIO(names))
+    out = io.StringIO()
+    monkeypatch.setattr(sys, 'stdout', out)
+    exec(compile(whisper_controller._DOWNLOADER_SCRIPT, '<downloader>', 'exec'), {})
+    return out.getvalue().splitlines()
+
+
+def test_script_fetches_checkpoint_without_loading_model(monkeypatch, tmp_path):
+    fetched = []
+    fake = types.SimpleNamespace(
+        _MODELS={'tiny': 'https://example.invalid/tiny.pt'},
+        _download=lambda url, root, in_memory: fetched.append((url, root, in_memory)),
+        load_model=lambda *args, **kwargs: pytest.fail("model should not be built"),
+    )
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+
+    assert run_helper_script(monkeypatch, fake, "tiny\n\n") == ['DONE:tiny']
+    assert fetched == [('https://example.invalid/tiny.pt', str(tmp_path / 'whisper'), False)]
+
+
+def test_script_falls_back_to_cpu_load(monkeypatch):
+    loaded = []
+    fake = types.SimpleNamespace(load_model=lambda name, device=None: loaded.append((name, device)))
+
+    assert run_helper_script(monkeypatch, fake, "base\n") == ['DONE:base']
+    assert loaded == [('base', 'cpu')]
+
+
+def test_script_reports_multiline_errors_on_one_line(monkeypatch):
+    def load_model(name, device=None):
+        raise RuntimeError("download failed\nchecksum mismatch")
+
+    fake = types.SimpleNamespace(load_model=load_model)
+
+    assert run_helper_script(monkeypatch, fake, "small\ntiny\n") == [
+        'FAILED:small:download failed checksum mismatch',
+        'FAILED:tiny:download failed checksum mismatch',
+    ]
@@ -0,0 +1,113 @@
+"""Unit tests for WhisperController output reading and line classification."""
+
+import os
+import threading
+
+import pytest
+
+import whisper_controller
+from whisper_controller import WhisperController, PIPE_BUFFER_SIZE
+
+
+def read_all(data: bytes, stop: threading.Event = None) -> list:
+    """Feed data through a real pipe into _read_output_stream and collect output.
+
+    Args:
+        data: Bytes the fake child process writes before closing the pipe
+        stop: Stop token passed to the reader
+
+    Returns:
+        List of (stream_type, line) tuples delivered to the output callback
+    """
+    controller = WhisperController()
+    received = []
+    controller.set_process_output_callback(lambda kind, line: received.append((kind, line)))
+
+    read_fd, write_fd = os.pipe()
+
+    # Write from a thread so data larger than the pipe capacity cannot block
+    def writer():
+        try:
+            with os.fdopen(write_fd, 'wb') as f:
+                f.write(data)
+        except BrokenPipeError:
+            # The reader stopped early and closed its end
+            pass
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    controller._read_output_stream(os.fdopen(read_fd, 'rb'), 'stdout', stop or threading.Event())
+    thread.join()
+    return received
+
+
+def test_complete_lines_are_split():
+    assert read_all(b'one\ntwo\nthree\n') == [
+        ('stdout', 'one'), ('stdout', 'two'), ('stdout', 'three')
+    ]
+
+
+def test_partial_tail_is_flushed_at_eof():
+    assert read_all(b'first\nno newline') == [('stdout', 'first'), ('stdout', 'no newline')]
+
+
+def test_crlf_line_endings_are_stripped():
+    assert read_all(b'windows\r\nline\r\n') == [('stdout', 'windows'), ('stdout', 'line')]
+
+
+def test_blank_lines_are_skipped():
+    assert read_all(b'\n\nvalue\n   \n') == [('stdout', 'value')]
+
+
+def test_long_line_without_newline_spans_reads():
+    line = b'x' * (PIPE_BUFFER_SIZE * 3 + 17)
+    assert read_all(line + b'\nafter\n') == [('stdout', line.decode()), ('stdout', 'after')]
+
+
+def test_multibyte_character_at_read_boundary_is_decoded():
+    prefix = b'a' * (PIPE_BUFFER_SIZE - 1)
+    received = read_all(prefix + 'é\n'.encode('utf-8'))
+    assert received == [('stdout', prefix.decode() + 'é')]
+
+
+def test_output_after_stop_is_discarded():
+    stop = threading.Event()
+    stop.set()
+    assert read_all(b'late output\n', stop) == []
+
+
+def test_batch_callback_receives_one_list_per_block():
+    controller = WhisperController()
+    batches = []
+    controller.set_process_output_batch_callback(batches.append)
+
+    controller._dispatch_output(b'one\ntwo', 'stdout')
+
+    assert batches == [[('stdout', 'one'), ('stdout', 'two')]]
+
+
+def test_no_consumer_skips_decoding():
+    controller = WhisperController()
+    # Decoding this would raise AttributeError
+    controller._dispatch_output(object(), 'stdout')
+
+
+@pytest.mark.parametrize('line', [
+    'Traceback (most recent call last):',
+    '  File "ptt_whisper.py", line 3, in <module>',
+    'ModuleNotFoundError: No module named whisper',
+    'RuntimeError: CUDA out of memory',
+    'UserWarning: FP16 is not supported on CPU',
+])
+def test_error_lines_are_reported_as_stderr(line):
+    assert whisper_controller._ERROR_LINE_RE.match(line)
+    assert read_all(line.encode() + b'\n') == [('stderr', line)]
+
+
+@pytest.mark.parametrize('line', [
+    'Recording...',
+    'Transcribed: no errors here',
+    'Loading model base',
+])
+def test_ordinary_lines_are_reported_as_stdout(line):
+    assert read_all(line.encode() + b'\n') == [('stdout', line)]
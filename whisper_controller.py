@@ -5,18 +5,80 @@ Handles process lifecycle, status monitoring, and model downloads.
 
 import subprocess
 import os
+import re
 import sys
-import time
 import threading
 import psutil
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, List, Tuple
 from pathlib import Path
-from config import config
+from config import Config, get_config
+
+# Bytes requested per os.read() by the output reader, and the buffer size
+# of the download helper's pipe so its readline() loop refills in large chunks
+PIPE_BUFFER_SIZE = 64 * 1024
+
+# Kernel pipe capacity requested for child output (Python 3.10+), so a
+# chatty child does not block on a full pipe while the reader is busy
+PIPE_CAPACITY = 1024 * 1024
+_PIPESIZE_KWARGS = {'pipesize': PIPE_CAPACITY} if sys.version_info >= (3, 10) else {}
+
+# Keep child processes from opening a console window on Windows
+_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+
+# `python --version` output keyed by (interpreter path, mtime in ns), so
+# repeated starts skip spawning the interpreter just to read its version
+_PYVER_CACHE: Dict[Tuple[str, int], str] = {}
+
+# Helper for download_model(): reads model names from stdin and reports each
+# one with a DONE:/FAILED: marker line, so back-to-back downloads import
+# whisper and PyTorch once. Only the checkpoint file is fetched; the model is
+# never built, so no weights are loaded into RAM or onto the GPU.
+_DOWNLOADER_SCRIPT = """\
+import os
+import sys
+import whisper
+
+def fetch(name):
+    models = getattr(whisper, "_MODELS", None)
+    download = getattr(whisper, "_download", None)
+    if models is None or download is None or name not in models:
+        # Unknown whisper version: load once on the CPU instead
+        whisper.load_model(name, device="cpu")
+        return
+    cache = os.getenv("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    download(models[name], os.path.join(cache, "whisper"), False)
+
+for line in sys.stdin:
+    name = line.strip()
+    if not name:
+        continue
+    try:
+        fetch(name)
+    except Exception as e:
+        # One line, so the whole message is consumed with the marker
+        message = " ".join(str(e).split())
+        print(f"FAILED:{name}:{message}", flush=True)
+    else:
+        print(f"DONE:{name}", flush=True)
+"""
+
+# stderr is merged into stdout; lines matching this are reported as 'stderr'
+_ERROR_LINE_RE = re.compile(r'^(Traceback |\s+File "|\w*(Error|Exception|Warning)\b)')
 
 
 class WhisperController:
     """Controller for Whisper Auto process management."""
 
+    # Seconds start() waits for the child to fail before treating it as running;
+    # matches the old fixed startup check so early import errors are still caught
+    STARTUP_PROBE_TIMEOUT = 0.5
+
+    # Seconds the download helper may sit idle before it is shut down
+    DOWNLOADER_IDLE_TIMEOUT = 30.0
+
+    # Seconds stop() waits for each reader thread once the child has exited
+    READER_JOIN_TIMEOUT = 0.05
+
     def __init__(self):
         """Initialize Whisper controller."""
         self.process: Optional[subprocess.Popen] = None
@@ -24,11 +86,28 @@ class WhisperController:
         self.status_callback: Optional[Callable] = None
         self.log_callback: Optional[Callable] = None
         self.process_output_callback: Optional[Callable] = None
+        self.process_output_batch_callback: Optional[Callable] = None
         self.output_threads: list = []
-        self.stop_output_reading = False
+        # Stop token of the current reader; each start() gets a fresh one so
+        # a reader left over from an earlier process never picks up new output
+        self._output_stop: Optional[threading.Event] = None
+        self.debug_echo = False  # Also echo process output to the log callback
+        self.monitor_thread: Optional[threading.Thread] = None
+        self._ps_proc: Optional[psutil.Process] = None
+        self._stopping = False
+        self._last_status_key: Optional[tuple] = None
+        self._downloader: Optional[subprocess.Popen] = None
+        self._downloader_python: Optional[str] = None
+        self._download_lock = threading.Lock()
+        self._downloader_idle_timer: Optional[threading.Timer] = None
+
+    def set_status_callback(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Set callback for status updates.
 
-    def set_status_callback(self, callback: Callable[[str], None]) -> None:
-        """Set callback for status updates."""
+        Args:
+            callback: Function accepting the status dictionary from get_status().
+                Called only when the running state, PID or model changes.
+        """
         self.status_callback = callback
 
     def set_log_callback(self, callback: Callable[[str], None]) -> None:
@@ -43,40 +122,87 @@ class WhisperController:
         """
         self.process_output_callback = callback
 
+    def set_process_output_batch_callback(
+            self, callback: Callable[[List[Tuple[str, str]]], None]) -> None:
+        """Set callback for process output delivered in batches.
+
+        Called once per block read from the pipe, which saves per-line
+        cross-thread handoffs when the process output is chatty.
+
+        Args:
+            callback: Function accepting a list of (stream_type, message) tuples
+        """
+        self.process_output_batch_callback = callback
+
     def _log(self, message: str) -> None:
         """Send log message to callback."""
         if self.log_callback:
             self.log_callback(message)
 
-    def _update_status(self, status: str) -> None:
-        """Send status update to callback."""
+    def _update_status(self) -> None:
+        """Send status update to callback if the process state changed."""
+        status = self.get_status()
+        key = (status['running'], status['pid'], status['model'])
+        if key == self._last_status_key:
+            return
+        self._last_status_key = key
+
         if self.status_callback:
             self.status_callback(status)
 
-    def _read_output_stream(self, stream, stream_name: str) -> None:
+    def _monitor_process(self, process: subprocess.Popen) -> None:
+        """Wait for the process to exit and report unexpected terminations.
+
+        Args:
+            process: The process started by start()
+        """
+        returncode = process.wait()
+
+        # stop() reports its own status change
+        if self._stopping or self.process is not process:
+            return
+
+        self._log(f"Whisper process exited (code: {returncode})")
+        self.pid = None
+        self.process = None
+        self._ps_proc = None
+        self._update_status()
+
+    def _read_output_stream(self, stream, stream_name: str,
+                            stop: threading.Event) -> None:
         """Read output from a process stream in a background thread.
 
+        The Whisper process writes stderr into the same pipe, so lines that
+        look like errors, tracebacks or warnings are reported as 'stderr'.
+        The stream is owned by this reader and closed when it exits.
+
         Args:
-            stream: The stream to read from (stdout or stderr)
-            stream_name: Name of the stream ('stdout' or 'stderr')
+            stream: The stream to read from
+            stream_name: Name reported for ordinary lines ('stdout')
+            stop: Set by stop(); output read afterwards is discarded
         """
         try:
-            for line in iter(stream.readline, b''):
-                if self.stop_output_reading:
+            fd = stream.fileno()
+            # Grows in place, so a long burst without newlines is not
+            # copied again on every read
+            pending = bytearray()
+            while not stop.is_set():
+                # One syscall per available block instead of one call per line
+                chunk = os.read(fd, PIPE_BUFFER_SIZE)
+                if not chunk or stop.is_set():
                     break
 
-                # Decode and strip the line
-                try:
-                    decoded_line = line.decode('utf-8', errors='replace').rstrip()
-                except Exception:
-                    decoded_line = str(line).rstrip()
+                pending += chunk
+                # Only the new chunk can hold a newline not yet dispatched
+                newline = chunk.rfind(b'\n')
+                if newline >= 0:
+                    end = len(pending) - len(chunk) + newline
+                    self._dispatch_output(pending[:end], stream_name)
+                    del pending[:end + 1]
 
-                # Only send non-empty lines
-                if decoded_line:
-                    if self.process_output_callback:
-                        self.process_output_callback(stream_name, decoded_line)
-                    # Also log to main log for debugging
-                    self._log(f"[{stream_name.upper()}] {decoded_line}")
+            # Output left without a trailing newline when the stream closed
+            if pending and not stop.is_set():
+                self._dispatch_output(pending, stream_name)
 
         except Exception as e:
             self._log(f"Error reading {stream_name}: {str(e)}")
@@ -87,17 +213,109 @@ class WhisperController:
             except Exception:
                 pass
 
+    def _dispatch_output(self, data: bytes, stream_name: str) -> None:
+        """Decode a block of complete output lines and send them to the callbacks.
+
+        Args:
+            data: Raw output containing one or more lines
+            stream_name: Name reported for ordinary lines
+        """
+        output_callback = self.process_output_callback
+        batch_callback = self.process_output_batch_callback
+        echo_callback = self.log_callback if self.debug_echo else None
+
+        # Nobody consumes the output, so skip decoding it
+        if not output_callback and not batch_callback and not echo_callback:
+            return
+
+        batch = []
+
+        # Decode the whole block once, then split in C
+        for line in data.decode('utf-8', errors='replace').split('\n'):
+            line = line.rstrip()
+
+            # Only send non-empty lines
+            if line:
+                line_type = 'stderr' if _ERROR_LINE_RE.match(line) else stream_name
+                if output_callback:
+                    output_callback(line_type, line)
+                if batch_callback:
+                    batch.append((line_type, line))
+                # Optionally echo to the main log for debugging
+                if echo_callback:
+                    echo_callback("[" + line_type.upper() + "] " + line)
+
+        if batch:
+            batch_callback(batch)
+
+    def _get_ps_process(self, pid: Optional[int] = None) -> psutil.Process:
+        """Get the cached psutil.Process for the current PID, creating it if needed.
+
+        Args:
+            pid: PID to look up instead of reading self.pid again
+
+        Raises:
+            psutil.NoSuchProcess: If the process no longer exists
+            psutil.AccessDenied: If the process cannot be inspected
+        """
+        if pid is None:
+            pid = self.pid
+        if pid is None:
+            # psutil.Process(None) would be this GUI process
+            raise psutil.NoSuchProcess(0)
+        ps_proc = self._ps_proc
+        if ps_proc is None or ps_proc.pid != pid:
+            ps_proc = self._ps_proc = psutil.Process(pid)
+        return ps_proc
+
     def is_running(self) -> bool:
         """Check if Whisper process is running."""
-        if self.pid is None:
+        # stop() and the monitor thread clear these from other threads, so
+        # read each once
+        pid, child = self.pid, self.process
+        if pid is None:
             return False
 
+        # Our own child: a non-blocking waitpid is enough, no /proc parsing
+        if child is not None and child.pid == pid:
+            return child.poll() is None
+
         try:
-            process = psutil.Process(self.pid)
+            process = self._get_ps_process(pid)
             return process.is_running() and process.status() != psutil.STATUS_ZOMBIE
         except (psutil.NoSuchProcess, psutil.AccessDenied):
+            self._ps_proc = None
             return False
 
+    def _get_python_version(self, python_path: str, mtime_ns: int) -> str:
+        """Get the `python --version` output for an interpreter.
+
+        Results are cached until the interpreter file changes.
+
+        Args:
+            python_path: Path to the Python interpreter
+            mtime_ns: Modification time of the interpreter from os.stat()
+
+        Returns:
+            Version line such as 'Python 3.11.7'
+        """
+        key = (python_path, mtime_ns)
+        version_line = _PYVER_CACHE.get(key)
+        if version_line is None:
+            # Older interpreters print the version to stderr, so merge it
+            # into a single pipe
+            result = subprocess.run(
+                [python_path, '--version'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                timeout=5,
+                creationflags=_CREATION_FLAGS
+            )
+            version_line = result.stdout.strip()
+            _PYVER_CACHE[key] = version_line
+        return version_line
+
     def start(self, model: Optional[str] = None) -> bool:
         """
         Start Whisper Auto process.
@@ -112,13 +330,16 @@ class WhisperController:
             self._log("Error: Whisper is already running")
             return False
 
+        config = get_config()
         script_path = config.get_script_path()
         if not script_path:
             self._log("Error: Whisper script path not configured")
             self._log("Action: Click 'Configure Paths' to set the script location")
             return False
 
-        if not os.path.exists(script_path):
+        try:
+            os.stat(script_path)
+        except OSError:
             self._log(f"Error: Whisper script not found at {script_path}")
             self._log("Action: Verify the file exists or update the path")
             return False
@@ -129,7 +350,10 @@ class WhisperController:
             return False
 
         python_path = config.get_python_path()
-        if not os.path.exists(python_path):
+        # One stat serves the existence check and the version cache key
+        try:
+            python_stat = os.stat(python_path)
+        except OSError:
             self._log(f"Error: Python interpreter not found at {python_path}")
             self._log("Action: Install Python or update the interpreter path")
             return False
@@ -141,13 +365,7 @@ class WhisperController:
 
         # Check Python version
         try:
-            result = subprocess.run(
-                [python_path, '--version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            version_line = result.stdout.strip() if result.stdout else result.stderr.strip()
+            version_line = self._get_python_version(python_path, python_stat.st_mtime_ns)
 
             if 'Python 3.' not in version_line:
                 self._log(f"Error: Invalid Python version: {version_line}")
@@ -171,7 +389,7 @@ class WhisperController:
                 # Couldn't parse version, but "Python 3." was in output, so proceed
                 self._log(f"Python version check: {version_line}")
 
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError) as e:
+        except (subprocess.SubprocessError, OSError) as e:
             self._log(f"Error: Could not verify Python version at {python_path}")
             self._log(f"Details: {str(e)}")
             self._log("Action: Ensure Python is properly installed")
@@ -184,7 +402,8 @@ class WhisperController:
             cmd = [python_path, '-u', script_path]  # -u flag forces unbuffered output
 
             self._log(f"Starting Whisper with model: {model}")
-            self._log(f"Command: {' '.join(cmd)}")
+            if self.log_callback:
+                self._log(f"Command: {' '.join(cmd)}")
 
             # Start process with environment to ensure unbuffered output
             env = os.environ.copy()
@@ -193,49 +412,59 @@ class WhisperController:
             self.process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                stdin=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
                 env=env,
-                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+                creationflags=_CREATION_FLAGS,
+                **_PIPESIZE_KWARGS
             )
 
             self.pid = self.process.pid
+            self._ps_proc = None
 
-            # Reset the stop flag
-            self.stop_output_reading = False
-
-            # Start output reading threads
-            stdout_thread = threading.Thread(
+            # Start output reading thread (stderr is merged into stdout)
+            self._output_stop = threading.Event()
+            output_thread = threading.Thread(
                 target=self._read_output_stream,
-                args=(self.process.stdout, 'stdout'),
+                args=(self.process.stdout, 'stdout', self._output_stop),
                 daemon=True,
-                name="WhisperStdoutReader"
-            )
-            stderr_thread = threading.Thread(
-                target=self._read_output_stream,
-                args=(self.process.stderr, 'stderr'),
-                daemon=True,
-                name="WhisperStderrReader"
+                name="WhisperOutputReader"
             )
 
-            self.output_threads = [stdout_thread, stderr_thread]
-            stdout_thread.start()
-            stderr_thread.start()
+            self.output_threads = [output_thread]
+            output_thread.start()
 
-            self._log("Started output capture threads")
+            self._log("Started output capture thread")
 
-            # Wait a moment to check if it started successfully
-            time.sleep(0.5)
+            # Returns as soon as the child exits; a timeout means it is still
+            # running. Later exits are reported by the monitor thread.
+            try:
+                returncode = self.process.wait(timeout=self.STARTUP_PROBE_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                # Started only now so an immediate failure is reported once;
+                # an exit before it gets to wait() is still seen at once
+                self.monitor_thread = threading.Thread(
+                    target=self._monitor_process,
+                    args=(self.process,),
+                    daemon=True,
+                    name="WhisperProcessMonitor"
+                )
+                self.monitor_thread.start()
 
-            if self.is_running():
                 self._log(f"Whisper started successfully (PID: {self.pid})")
-                self._update_status("Running")
+                # The first cpu_percent() call only sets the baseline and
+                # returns 0.0; take it now so the first status poll is real
+                try:
+                    self._get_ps_process().cpu_percent()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    self._ps_proc = None
+                self._update_status()
                 return True
-            else:
-                self._log("Error: Whisper process terminated immediately")
-                self.pid = None
-                self.process = None
-                return False
+
+            self._log(f"Error: Whisper process terminated immediately (code: {returncode})")
+            self.pid = None
+            self.process = None
+            return False
 
         except Exception as e:
             self._log(f"Error starting Whisper: {str(e)}")
@@ -254,10 +483,11 @@ class WhisperController:
             self._log("Whisper is not running")
             return False
 
+        self._stopping = True
         try:
             self._log(f"Stopping Whisper (PID: {self.pid})")
 
-            process = psutil.Process(self.pid)
+            process = self._get_ps_process()
 
             # Try graceful termination first
             process.terminate()
@@ -275,24 +505,30 @@ class WhisperController:
 
             self.pid = None
             self.process = None
+            self._ps_proc = None
 
             # Signal output threads to stop
-            self.stop_output_reading = True
+            if self._output_stop is not None:
+                self._output_stop.set()
+                self._output_stop = None
 
-            # Wait for output threads to finish (with timeout)
+            # The child's end of the pipe closed with it, so readers hit EOF
+            # almost at once. One kept busy by a grandchild still holding the
+            # pipe is left to close it on EOF; its stop token keeps it quiet.
             for thread in self.output_threads:
-                if thread.is_alive():
-                    thread.join(timeout=2.0)
+                thread.join(timeout=self.READER_JOIN_TIMEOUT)
 
             self.output_threads = []
             self._log("Stopped output capture threads")
 
-            self._update_status("Stopped")
+            self._update_status()
             return True
 
         except Exception as e:
             self._log(f"Error stopping Whisper: {str(e)}")
             return False
+        finally:
+            self._stopping = False
 
     def restart(self, model: Optional[str] = None) -> bool:
         """
@@ -307,9 +543,9 @@ class WhisperController:
         self._log("Restarting Whisper...")
 
         if self.is_running():
+            # stop() only returns once the process has exited
             if not self.stop():
                 return False
-            time.sleep(1)
 
         return self.start(model)
 
@@ -320,24 +556,28 @@ class WhisperController:
         Returns:
             Dictionary with status information
         """
-        running = self.is_running()
+        pid = self.pid
+        running = pid is not None and self.is_running()
+        config = get_config()
 
         status = {
             'running': running,
-            'pid': self.pid if running else None,
+            'pid': pid if running else None,
             'model': config.get_selected_model(),
             'python_path': config.get_python_path(),
             'script_path': config.get_script_path(),
             'status_text': 'Running' if running else 'Stopped'
         }
 
-        if running and self.pid:
+        if running:
             try:
-                process = psutil.Process(self.pid)
-                status['memory_mb'] = process.memory_info().rss / 1024 / 1024
-                status['cpu_percent'] = process.cpu_percent()
+                process = self._get_ps_process(pid)
+                # Read /proc/<pid> once for both values
+                with process.oneshot():
+                    status['memory_mb'] = process.memory_info().rss / 1024 / 1024
+                    status['cpu_percent'] = process.cpu_percent()
             except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+                self._ps_proc = None
 
         return status
 
@@ -347,63 +587,146 @@ class WhisperController:
 
         Args:
             model: Model name to download
-            progress_callback: Optional callback for progress updates
+            progress_callback: Optional callback for progress updates; when
+                given, progress lines go there instead of the log callback
 
         Returns:
             True if download successful, False otherwise
         """
-        if model not in config.WHISPER_MODELS:
+        if model not in Config.WHISPER_MODELS_SET:
             self._log(f"Error: Invalid model '{model}'")
             return False
 
-        try:
-            self._log(f"Downloading Whisper model: {model}")
-
-            if progress_callback:
-                progress_callback(f"Preparing to download {model} model...")
-
-            # Import whisper to trigger model download
-            python_path = config.get_python_path()
-
-            cmd = [
-                python_path,
-                '-c',
-                f'import whisper; whisper.load_model("{model}")'
-            ]
+        with self._download_lock:
+            self._cancel_downloader_idle_timer()
+            try:
+                self._log(f"Downloading Whisper model: {model}")
 
-            self._log(f"Running: {' '.join(cmd)}")
+                if progress_callback:
+                    progress_callback(f"Preparing to download {model} model...")
+
+                downloader = self._get_downloader(get_config().get_python_path())
+                downloader.stdin.write(model + '\n')
+                downloader.stdin.flush()
+
+                # Relay progress until the helper reports this model
+                for line in iter(downloader.stdout.readline, ''):
+                    line = line.strip()
+                    if line == f"DONE:{model}":
+                        if progress_callback:
+                            progress_callback(f"Model '{model}' downloaded successfully!")
+                        else:
+                            self._log(f"Model '{model}' downloaded successfully")
+                        return True
+                    if line.startswith(f"FAILED:{model}:"):
+                        self._log(f"Error downloading model: {line.split(':', 2)[2]}")
+                        return False
+                    # Progress goes to one place only: the caller's callback
+                    # if given, otherwise the log
+                    if line:
+                        if progress_callback:
+                            progress_callback(line)
+                        else:
+                            self._log(line)
+
+                # stdout closed: the helper exited (e.g. whisper not installed)
+                returncode = downloader.wait()
+                self.close_downloader()
+                self._log(f"Error downloading model (exit code: {returncode})")
+                return False
 
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True
-            )
+            except Exception as e:
+                if progress_callback:
+                    progress_callback(f"Error: {str(e)}")
+                else:
+                    self._log(f"Error downloading model: {str(e)}")
+                self.close_downloader()
+                return False
+            finally:
+                self._start_downloader_idle_timer()
+
+    def _start_downloader_idle_timer(self) -> None:
+        """Schedule the download helper to shut down if no download follows."""
+        if self._downloader is None:
+            return
+        timer = threading.Timer(self.DOWNLOADER_IDLE_TIMEOUT, self._close_idle_downloader)
+        timer.daemon = True
+        self._downloader_idle_timer = timer
+        timer.start()
+
+    def _cancel_downloader_idle_timer(self) -> None:
+        """Cancel a pending idle shutdown of the download helper."""
+        timer = self._downloader_idle_timer
+        self._downloader_idle_timer = None
+        if timer is not None:
+            timer.cancel()
+
+    def _close_idle_downloader(self) -> None:
+        """Shut down the download helper unless a download has started."""
+        # A download in progress re-arms the timer when it finishes
+        if not self._download_lock.acquire(blocking=False):
+            return
+        try:
+            self.close_downloader()
+        finally:
+            self._download_lock.release()
 
-            # Read output line by line
-            for line in iter(process.stdout.readline, ''):
-                line = line.strip()
-                if line:
-                    self._log(line)
-                    if progress_callback:
-                        progress_callback(line)
+    def _get_downloader(self, python_path: str) -> subprocess.Popen:
+        """Return the download helper process, starting it if needed.
 
-            process.wait()
+        Args:
+            python_path: Interpreter the helper must run under
 
-            if process.returncode == 0:
-                self._log(f"Model '{model}' downloaded successfully")
-                if progress_callback:
-                    progress_callback(f"Model '{model}' downloaded successfully!")
-                return True
-            else:
-                self._log(f"Error downloading model (exit code: {process.returncode})")
-                return False
+        Returns:
+            The running helper process
+        """
+        downloader = self._downloader
+        if (downloader is not None and downloader.poll() is None
+                and self._downloader_python == python_path):
+            return downloader
+
+        self.close_downloader()
+
+        cmd = [python_path, '-u', '-c', _DOWNLOADER_SCRIPT]
+        self._log(f"Starting model downloader with {python_path}")
+
+        self._downloader = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True,
+            bufsize=PIPE_BUFFER_SIZE,
+            creationflags=_CREATION_FLAGS,
+            **_PIPESIZE_KWARGS
+        )
+        self._downloader_python = python_path
+        return self._downloader
+
+    def close_downloader(self) -> None:
+        """Shut down the download helper process, if one is running.
+
+        Does not take the download lock, so closing the window never waits
+        for a download to finish. A download in progress then sees the
+        helper's output end (or its stdin closed) and returns False.
+        """
+        self._cancel_downloader_idle_timer()
+        downloader = self._downloader
+        self._downloader = None
+        self._downloader_python = None
+        if downloader is None:
+            return
 
-        except Exception as e:
-            self._log(f"Error downloading model: {str(e)}")
-            if progress_callback:
-                progress_callback(f"Error: {str(e)}")
-            return False
+        try:
+            # EOF on stdin ends the helper's loop
+            downloader.stdin.close()
+            downloader.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            downloader.kill()
+            downloader.wait()
+        finally:
+            if downloader.stdout:
+                downloader.stdout.close()
 
 
 # Global controller instance